@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+APIpedia - 静的アセットのフィンガープリント（デプロイ時に実行）
+CSS・OGP 画像・データJSONを内容ハッシュ付きのファイル名（style.{hash}.css）にリネームし、
+docs/ 配下の HTML/CSS/JS からの参照を書き換える。
+og-image.png と data/*.json は外部から元の URL で参照されるため、元のファイルも残す。
+
+ハッシュ付きファイル（immutable）と data/*.json（短期キャッシュ）の Cache-Control は
+vercel.json に静的ルールとして定義している。HASH_LEN や対象拡張子を変えたら合わせて更新すること。
+
+docs/ を書き換えるため、generate-pages.py の後にビルド成果物に対して実行すること。
+
+Usage: python fingerprint-assets.py [--in-place]
+  --in-place を付けない場合はハッシュと参照数を表示するだけで、ファイルは書き換えない。
+"""
+
+import fnmatch
+import glob
+import hashlib
+import os
+import posixpath
+import re
+import shutil
+import sys
+
+DOCS_DIR = os.path.join(os.path.dirname(__file__), '..', 'docs')
+
+# docs/ からの相対パス（glob）。CSS は画像を参照しうるので最後に処理する
+ASSET_PATTERNS = [
+    'og-image.png',
+    'data/*.json',
+    'assets/*.css',
+]
+REWRITE_EXTENSIONS = ('.html', '.css', '.js')
+# 外部（SNS の OGP キャッシュ・公開データの利用者）から元の URL で参照されるため、
+# 元のファイルを残してハッシュ付きをコピーとして追加する
+KEEP_ORIGINAL_PATTERNS = ['og-image.png', 'data/*.json']
+
+HASH_LEN = 10
+FINGERPRINT_RE = re.compile(r'\.[0-9a-f]{%d}\.[a-z0-9]+$' % HASH_LEN)
+
+# 引用符・括弧で囲まれた URL（クエリ・フラグメントは対象外として残す）
+URL_RE = re.compile(r'''(["'(])([^"'()\s<>?#]+)''')
+
+
+def file_hash(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()[:HASH_LEN]
+
+
+def fingerprinted_name(rel_path, digest):
+    base, ext = posixpath.splitext(rel_path)
+    return f'{base}.{digest}{ext}'
+
+
+def resolve_url(url, page_rel_dir):
+    """ページ内の URL を docs/ からの相対パスに解決する（外部URLは None）"""
+    if '://' in url or url.startswith(('//', 'data:', 'mailto:', 'javascript:')):
+        return None
+    if url.startswith('/'):
+        return posixpath.normpath(url.lstrip('/'))
+    return posixpath.normpath(posixpath.join(page_rel_dir, url))
+
+
+def rewrite_references(path, mapping, write=True):
+    """ファイル内のアセット参照をハッシュ付きの名前に書き換える。書き換えた（write=False なら該当する）件数を返す"""
+    rel_dir = posixpath.dirname(os.path.relpath(path, DOCS_DIR).replace(os.sep, '/'))
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    count = 0
+
+    def replace(m):
+        nonlocal count
+        url = m.group(2)
+        target = resolve_url(url, rel_dir)
+        if target not in mapping:
+            return m.group(0)
+        count += 1
+        # 元の書き方（相対/絶対）を保ったままファイル名だけ差し替える
+        return m.group(1) + posixpath.join(posixpath.dirname(url), posixpath.basename(mapping[target]))
+
+    new_content = URL_RE.sub(replace, content)
+    if count and write:
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(new_content)
+    return count
+
+
+def collect_assets():
+    assets = []
+    for pattern in ASSET_PATTERNS:
+        for path in sorted(glob.glob(os.path.join(DOCS_DIR, pattern))):
+            rel = os.path.relpath(path, DOCS_DIR).replace(os.sep, '/')
+            if FINGERPRINT_RE.search(rel):
+                continue  # already fingerprinted
+            assets.append(rel)
+    return assets
+
+
+def main():
+    dry_run = '--in-place' not in sys.argv[1:]
+
+    assets = collect_assets()
+    pages = [
+        path for path in glob.glob(os.path.join(DOCS_DIR, '**', '*'), recursive=True)
+        if path.endswith(REWRITE_EXTENSIONS) and os.path.isfile(path)
+    ]
+
+    mapping = {}
+    for rel in assets:
+        path = os.path.join(DOCS_DIR, rel)
+        # Rewrite references inside the asset itself before hashing it (CSS -> images)
+        if rel.endswith(REWRITE_EXTENSIONS):
+            rewrite_references(path, mapping, write=not dry_run)
+        hashed = fingerprinted_name(rel, file_hash(path))
+        if not dry_run:
+            if any(fnmatch.fnmatch(rel, pattern) for pattern in KEEP_ORIGINAL_PATTERNS):
+                shutil.copy2(path, os.path.join(DOCS_DIR, hashed))
+            else:
+                os.replace(path, os.path.join(DOCS_DIR, hashed))
+        mapping[rel] = hashed
+        print(f'  {rel} -> {hashed}')
+
+    asset_paths = {os.path.join(DOCS_DIR, p) for p in list(mapping) + list(mapping.values())}
+    rewritten = 0
+    references = 0
+    for path in pages:
+        if path in asset_paths or not os.path.exists(path):
+            continue
+        count = rewrite_references(path, mapping, write=not dry_run)
+        if count:
+            rewritten += 1
+            references += count
+
+    prefix = '[dry-run] ' if dry_run else ''
+    print(f'{prefix}Fingerprinted {len(mapping)} assets')
+    print(f'{prefix}Rewrote {references} references in {rewritten} files')
+
+
+if __name__ == '__main__':
+    main()
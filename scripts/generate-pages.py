@@ -1,16 +1,35 @@
 #!/usr/bin/env python3
 """
 APIpedia - 個別APIページ自動生成スクリプト
-apis.json を読み込み、各APIの詳細ページを docs/api/{id}/index.html に生成する。
+apis.json を読み込み、各APIの詳細ページを docs/api/{id}/index.html に、
+カテゴリ別の比較・ランキングガイドを docs/guides/{category}-api-ranking.html に生成する。
+手書きの比較ガイドには、マーカーコメントの位置にカタログから生成した比較表を差し込む。
 """
 
+import glob
+import hashlib
 import json
 import os
 import html
+import re
 
 DOCS_DIR = os.path.join(os.path.dirname(__file__), '..', 'docs')
 DATA_FILE = os.path.join(DOCS_DIR, 'data', 'apis.json')
-API_DIR = os.path.join(DOCS_DIR, 'api')
+GUIDES_DIR = os.path.join(DOCS_DIR, 'guides')
+
+# ガイドテンプレートを変更したら上げる（全ガイドを再生成させるため）
+# 共有フラグメント（カード・仕様・比較表の行）の出力はダイジェストに含まれるので、そちらの変更では不要
+GUIDE_TEMPLATE_VERSION = 2
+GUIDE_MIN_APIS = 2
+GUIDE_DIGEST_RE = re.compile(r'<!-- apipedia-guide-digest: ([0-9a-f]+) -->')
+GUIDES_INDEX_FILE = os.path.join(GUIDES_DIR, 'index.html')
+GUIDES_INDEX_BLOCK_RE = re.compile(
+    r'(<!-- apipedia-ranking-guides:start -->).*?(<!-- apipedia-ranking-guides:end -->)', re.S
+)
+# 手書きの比較ガイド内の差し込み位置（start にカテゴリIDを書く）
+CATALOG_TABLE_RE = re.compile(
+    r'(<!-- apipedia-catalog-table:start ([a-z0-9-]+) -->).*?(<!-- apipedia-catalog-table:end -->)', re.S
+)
 
 def escape(text):
     return html.escape(str(text)) if text else ''
@@ -35,32 +54,239 @@ AUTH_LABEL = {'apiKey': 'APIキー', 'oauth2': 'OAuth 2.0', 'bearer': 'Bearer To
 REGION_LABEL = {'japan': '日本', 'global': 'グローバル', 'both': '日本 / グローバル'}
 DIFFICULTY_LABEL = {'easy': '初級', 'medium': '中級', 'hard': '上級'}
 
-def generate_page(api, categories, all_apis=None):
+# ロケールごとのラベル表（生の文字列。HTML には HTML_LABELS のエスケープ済みの値を使う）
+# prefix は docs/ からの出力先（docs/{prefix}api/{id}/）
+# field_suffix: API の説明文などのデータ本文は apis.json の {field}{field_suffix}（descriptionEn など）を使い、
+# なければ既定ロケール（日本語）の本文に lang="ja" を付けて表示する
+LOCALES = {
+    'ja': {
+        'lang': 'ja',
+        'native_name': '日本語',
+        'og_locale': 'ja_JP',
+        'prefix': '',
+        'field_suffix': '',
+        'pricing': PRICING_LABEL,
+        'auth': AUTH_LABEL,
+        'region': REGION_LABEL,
+        'difficulty': DIFFICULTY_LABEL,
+        'category_names': {},
+        'text': {
+            'site_tagline': '日本語APIカタログ',
+            'home': 'ホーム',
+            'top': 'トップ',
+            'catalog': 'カタログ',
+            'guides': 'ガイド',
+            'theme_toggle': 'テーマ切替',
+            'theme_toggle_title': 'ダーク/ライトモード切替',
+            'menu': 'メニュー',
+            'featured': '注目',
+            'score_label': '人気スコア（100点満点）',
+            'score_suffix': '点',
+            'analysis': '詳細分析',
+            'metrics': '利用実績・指標',
+            'monthlyUsers': '利用者数',
+            'monthlyApiCalls': 'APIコール数',
+            'marketShare': '市場ポジション',
+            'npmDownloads': 'npm ダウンロード',
+            'githubStars': 'GitHub Stars',
+            'adopters': '主な利用企業・サービス',
+            'sources': '根拠・参照元',
+            'trading': '取引可否（実行/照会）',
+            'evidence': '参照資料',
+            'spec': 'API仕様',
+            'spec_auth': '認証方式',
+            'spec_response': 'レスポンス形式',
+            'spec_rate_limit': 'レート制限',
+            'spec_pricing': '料金',
+            'spec_trading': '取引可否',
+            'rate_limit_default': 'ドキュメント参照',
+            'usecases': 'ユースケース',
+            'tags': 'タグ',
+            'related': '関連API（{icon} {category}）',
+            'guide_link': '{category}APIの比較・ランキングを見る',
+            'docs_button': 'ドキュメントを見る',
+            'official_site': '公式サイト',
+            'affiliate_label': '公式サイトへ',
+            'affiliate_disclosure': '※ アフィリエイトリンクを含みます',
+        },
+    },
+    'en': {
+        'lang': 'en',
+        'native_name': 'English',
+        'og_locale': 'en_US',
+        'prefix': 'en/',
+        'field_suffix': 'En',
+        'pricing': {'free': 'Free', 'freemium': 'Freemium', 'paid': 'Paid'},
+        'auth': {'apiKey': 'API key', 'oauth2': 'OAuth 2.0', 'bearer': 'Bearer Token', 'none': 'No auth'},
+        'region': {'japan': 'Japan', 'global': 'Global', 'both': 'Japan / Global'},
+        'difficulty': {'easy': 'Beginner', 'medium': 'Intermediate', 'hard': 'Advanced'},
+        'category_names': {
+            'weather': 'Weather', 'maps': 'Maps & Location', 'payment': 'Payments',
+            'social': 'Social', 'ai': 'AI & Machine Learning', 'data': 'Open Data',
+            'notification': 'Email & Notifications', 'media': 'Images & Media',
+            'auth': 'Authentication & Security', 'ecommerce': 'E-commerce & Marketplaces',
+            'language': 'Translation & Language', 'government': 'Government & Public',
+            'search': 'Search', 'storage': 'Storage', 'analytics': 'Analytics',
+            'devtools': 'Developer Tools', 'entertainment': 'Entertainment',
+            'healthcare': 'Healthcare', 'cms': 'CMS & Content', 'crm': 'CRM',
+            'nocode': 'No-code & Automation', 'iot': 'IoT & Hardware', 'travel': 'Travel & Transit',
+            'food': 'Food & Dining', 'logistics': 'Logistics & Shipping', 'realestate': 'Real Estate',
+            'education': 'Education', 'blockchain': 'Blockchain & Web3', 'security': 'Security',
+            'communication': 'Communication', 'financial-trading': 'Financial Trading',
+        },
+        'text': {
+            'site_tagline': 'API Catalog for Japan',
+            'home': 'Home',
+            'top': 'Home',
+            'catalog': 'Catalog',
+            'guides': 'Guides',
+            'theme_toggle': 'Toggle theme',
+            'theme_toggle_title': 'Switch dark/light mode',
+            'menu': 'Menu',
+            'featured': 'Featured',
+            'score_label': 'Popularity score (out of 100)',
+            'score_suffix': ' pts',
+            'analysis': 'Analysis',
+            'metrics': 'Adoption & metrics',
+            'monthlyUsers': 'Users',
+            'monthlyApiCalls': 'API calls',
+            'marketShare': 'Market position',
+            'npmDownloads': 'npm downloads',
+            'githubStars': 'GitHub Stars',
+            'adopters': 'Notable adopters',
+            'sources': 'Sources',
+            'trading': 'Trading access (execution / queries)',
+            'evidence': 'Reference',
+            'spec': 'API specs',
+            'spec_auth': 'Authentication',
+            'spec_response': 'Response format',
+            'spec_rate_limit': 'Rate limit',
+            'spec_pricing': 'Pricing',
+            'spec_trading': 'Trading access',
+            'rate_limit_default': 'See documentation',
+            'usecases': 'Use cases',
+            'tags': 'Tags',
+            'related': 'Related APIs ({icon} {category})',
+            'guide_link': '{category} API comparison & ranking (Japanese)',
+            'docs_button': 'View documentation',
+            'official_site': 'Official site',
+            'affiliate_label': 'Visit official site',
+            'affiliate_disclosure': '* Contains affiliate links',
+        },
+    },
+}
+DEFAULT_LOCALE = 'ja'
+METRIC_KEYS = ['monthlyUsers', 'monthlyApiCalls', 'marketShare', 'npmDownloads', 'githubStars']
+
+LABEL_TABLES = ('pricing', 'auth', 'region', 'difficulty', 'category_names', 'text')
+HTML_LABELS = {
+    lang: {table: {k: escape(v) for k, v in locale[table].items()} for table in LABEL_TABLES}
+    for lang, locale in LOCALES.items()
+}
+
+def render_chips(cls):
+    def render(values):
+        return ''.join(f'<span class="{cls}">{escape(v)}</span>' for v in values or [])
+    return render
+
+# ロケール別に切り替えるデータ本文: (record のキー, 親オブジェクト, フィールド名, HTML化)
+LOCALIZED_FIELDS = [
+    ('desc', None, 'description', escape),
+    ('reason', 'popularity', 'reason', escape),
+    ('detail', 'popularity', 'detail', escape),
+    ('adopters', 'popularity', 'adopters', render_chips('adopter-chip')),
+    ('usecases', None, 'useCases', render_chips('usecase-tag')),
+    ('tags', None, 'tags', render_chips('tag')),
+    ('trading_detail', 'tradingAccess', 'detail', escape),
+] + [(key, 'popularity', key, escape) for key in METRIC_KEYS]
+
+def localized_value(obj, field, locale, default=None):
+    """ロケール別フィールドの値と、既定ロケールの本文にフォールバックしたかどうか"""
+    suffix = locale['field_suffix']
+    if suffix and obj.get(field + suffix):
+        return obj[field + suffix], False
+    value = obj.get(field, default)
+    return value, bool(suffix and value)
+
+def lang_attr(fallback):
+    """フォールバックした本文の要素に付ける lang 属性"""
+    return f' lang="{LOCALES[DEFAULT_LOCALE]["lang"]}"' if fallback else ''
+
+def fallback_span(value, fallback):
+    return f'<span{lang_attr(True)}>{value}</span>' if fallback and value else value
+
+def locale_root(locale):
+    """API詳細ページから docs/ ルートへの相対パス"""
+    return '../../' + '../' * locale['prefix'].count('/')
+
+def category_name(cat, locale):
+    return HTML_LABELS[locale['lang']]['category_names'].get(cat['id']) or escape(cat['name'])
+
+# APIごとのエスケープ済みHTMLフラグメント（詳細ページとガイドで共有）
+_fragment_cache = {}
+
+def cached_fragment(render, api, locale=LOCALES[DEFAULT_LOCALE]):
+    key = (render.__name__, locale['lang'], api['id'])
+    if key not in _fragment_cache:
+        _fragment_cache[key] = render(api, locale)
+    return _fragment_cache[key]
+
+def render_card_fragment(api, locale):
+    """関連API/ランキングカードの中身（リンク先は呼び出し側で付与）"""
+    labels = HTML_LABELS[locale['lang']]
+    score = api.get('popularity', {}).get('score', 0)
+    desc, fallback = localized_value(api, 'description', locale, '')
+    return (
+        f'<div class="related-api-name">{escape(api["name"])}</div>'
+        f'<div class="related-api-desc"{lang_attr(fallback)}>{escape(desc[:60])}{"..." if len(desc) > 60 else ""}</div>'
+        f'<div class="related-api-meta">'
+        f'<span class="pill pill--{api.get("pricing", "")}">{labels["pricing"].get(api.get("pricing", ""), "")}</span>'
+        f'{"<span class=score-mini score-mini--" + get_popularity_class(score) + ">" + str(score) + labels["text"]["score_suffix"] + "</span>" if score else ""}'
+        f'</div>'
+    )
+
+def render_spec_fragment(api, locale):
+    """API仕様の各値（エスケープ済み。フォールバックした本文は lang 付きの span で囲む）"""
+    labels = HTML_LABELS[locale['lang']]
+    rate_limit, rate_limit_fallback = localized_value(api, 'rateLimit', locale)
+    pricing_detail, pricing_detail_fallback = localized_value(api, 'pricingDetail', locale, '-')
+    trading_label, trading_label_fallback = localized_value(api.get('tradingAccess', {}), 'label', locale, '')
+    return {
+        'auth': labels['auth'].get(api.get('auth', ''), ''),
+        'response_fmt': escape(', '.join(api.get('responseFormat', []))),
+        'rate_limit': fallback_span(escape(rate_limit), rate_limit_fallback) if rate_limit else labels['text']['rate_limit_default'],
+        'pricing_detail': fallback_span(escape(pricing_detail), pricing_detail_fallback),
+        'trading_label': fallback_span(escape(trading_label), trading_label_fallback),
+        'sdks': escape(', '.join(api.get('sdks', []))),
+    }
+
+def render_row_fragment(api, locale):
+    """比較表の1行のうち順位以外のセル（API名リンク・スコア・料金・認証・レート制限・料金詳細・地域・難易度）"""
+    labels = HTML_LABELS[locale['lang']]
+    spec = cached_fragment(render_spec_fragment, api, locale)
+    score = api.get('popularity', {}).get('score', 0)
+    return (
+        f'<td class="api-name"><a href="/{locale["prefix"]}api/{escape(api["id"])}/">{escape(api["name"])}</a></td>'
+        f'<td><span class="score-mini score-mini--{get_popularity_class(score)}">{score}</span></td>'
+        f'<td><span class="pill pill--{api.get("pricing", "")}">{labels["pricing"].get(api.get("pricing", ""), "")}</span></td>'
+        f'<td>{spec["auth"]}</td>'
+        f'<td>{spec["rate_limit"]}</td>'
+        f'<td>{spec["pricing_detail"]}</td>'
+        f'<td>{labels["region"].get(api.get("region", ""), "")}</td>'
+        f'<td>{labels["difficulty"].get(api.get("difficulty", ""), "")}</td>'
+    )
+
+def sort_by_popularity(apis):
+    return sorted(apis, key=lambda a: a.get('popularity', {}).get('score', 0), reverse=True)
+
+def prepare_record(api, categories, all_apis=None):
+    """ロケールに依存しない処理（エスケープ・関連API選定・JSON-LD・URL）を1レコードにつき1回だけ行う"""
     cat = next((c for c in categories if c['id'] == api['category']), None)
     pop = api.get('popularity', {})
     score = pop.get('score', 0)
     pop_cls = get_popularity_class(score)
-    gradient = get_score_gradient(pop_cls)
-    score_color = get_score_color(pop_cls)
-
-    name = escape(api['name'])
-    name_ja = escape(api.get('nameJa', api['name']))
-    desc = escape(api['description'])
-    cat_name = escape(cat['name']) if cat else ''
-    cat_icon = cat.get('icon', '') if cat else ''
-    pricing = PRICING_LABEL.get(api.get('pricing', ''), '')
-    auth = AUTH_LABEL.get(api.get('auth', ''), '')
-    region = REGION_LABEL.get(api.get('region', ''), '')
-    difficulty = DIFFICULTY_LABEL.get(api.get('difficulty', ''), '')
-    rate_limit = escape(api.get('rateLimit', 'ドキュメント参照'))
-    pricing_detail = escape(api.get('pricingDetail', '-'))
-    response_fmt = ', '.join(api.get('responseFormat', []))
-    sdks = ', '.join(api.get('sdks', []))
-    use_cases = api.get('useCases', [])
-    tags = api.get('tags', [])
     trading_access = api.get('tradingAccess', {})
-    trading_label = escape(trading_access.get('label', ''))
-    trading_detail = escape(trading_access.get('detail', ''))
+    affiliate = api.get('affiliate', {})
 
     # JSON-LD structured data
     jsonld = json.dumps({
@@ -79,109 +305,174 @@ def generate_page(api, categories, all_apis=None):
         }
     }, ensure_ascii=False)
 
+    # Related APIs (same category, excluding self, sorted by popularity, top 5)
+    related = []
+    has_guide = False
+    if all_apis and cat:
+        members = [a for a in all_apis if a['category'] == api['category']]
+        related = sort_by_popularity(a for a in members if a['id'] != api['id'])[:5]
+        has_guide = len(members) >= GUIDE_MIN_APIS
+
+    # ロケール別の本文。既定ロケールの本文は1回だけHTML化し、上書きのないロケールでも使い回す
+    source = {}
+    localized = {}
+    for locale in LOCALES.values():
+        fields = {}
+        for key, parent, field, render in LOCALIZED_FIELDS:
+            obj = api.get(parent, {}) if parent else api
+            value, fallback = localized_value(obj, field, locale, '')
+            if fallback or not locale['field_suffix']:
+                if key not in source:
+                    source[key] = render(obj.get(field, ''))
+                fields[key] = (source[key], fallback)
+            else:
+                fields[key] = (render(value), False)
+        localized[locale['lang']] = fields
+
+    return {
+        'api': api,
+        'id': escape(api['id']),
+        'cat': cat,
+        'pop': pop,
+        'score': score,
+        'gradient': get_score_gradient(pop_cls),
+        'score_color': get_score_color(pop_cls),
+        'name': escape(api['name']),
+        'name_ja': escape(api.get('nameJa', api['name'])),
+        'localized': localized,
+        'sources': ''.join(f'<li><a href="{escape(s["url"])}" target="_blank" rel="noopener" class="source-link">{escape(s["label"])}</a></li>' for s in pop.get('sources', [])),
+        'trading_access': bool(trading_access),
+        'evidence': [(escape(item['url']), escape(item.get('label', ''))) for item in trading_access.get('evidence', []) if item.get('url')],
+        'related': related,
+        'has_guide': has_guide,
+        'jsonld': jsonld,
+        'docs_url': escape(api.get('docsUrl') or api.get('url', '#')),
+        'affiliate': bool(affiliate.get('enabled')),
+        'official_url': escape(affiliate.get('url', api.get('url', '#')) if affiliate.get('enabled') else api.get('url', '#')),
+        'affiliate_label': escape(affiliate.get('label', '')) if affiliate.get('enabled') else '',
+    }
+
+
+def generate_page(record, locale):
+    api = record['api']
+    cat = record['cat']
+    score = record['score']
+    labels = HTML_LABELS[locale['lang']]
+    text = labels['text']
+    fields = record['localized'][locale['lang']]
+    # 日本語の名前・出典など、ロケールで切り替えないデータ本文に付ける lang 属性
+    data_lang = lang_attr(locale is not LOCALES[DEFAULT_LOCALE])
+    root = locale_root(locale)
+    api_id = record['id']
+    name = record['name']
+    name_ja = record['name_ja']
+    desc, desc_fallback = fields['desc']
+    gradient = record['gradient']
+    score_color = record['score_color']
+    cat_name = category_name(cat, locale) if cat else ''
+    cat_icon = cat.get('icon', '') if cat else ''
+    pricing = labels['pricing'].get(api.get('pricing', ''), '')
+    region = labels['region'].get(api.get('region', ''), '')
+    difficulty = labels['difficulty'].get(api.get('difficulty', ''), '')
+    spec = cached_fragment(render_spec_fragment, api, locale)
+
+    page_path = f'api/{api_id}/'
+    page_url = f'https://apipedia.dev/{locale["prefix"]}{page_path}'
+    alternates = ''.join(
+        f'<link rel="alternate" hreflang="{loc["lang"]}" href="https://apipedia.dev/{loc["prefix"]}{page_path}">\n'
+        for loc in LOCALES.values()
+    ) + f'<link rel="alternate" hreflang="x-default" href="https://apipedia.dev/{LOCALES[DEFAULT_LOCALE]["prefix"]}{page_path}">'
+    # Language switch: one link per other locale, labelled in that locale's own language
+    switch_link = '\n      '.join(
+        f'<a href="{root}{loc["prefix"]}{page_path}" class="nav-link" hreflang="{loc["lang"]}" lang="{loc["lang"]}">{loc["native_name"]}</a>'
+        for loc in LOCALES.values() if loc is not locale
+    )
+
     # BreadcrumbList JSON-LD
     breadcrumb_jsonld = json.dumps({
         "@context": "https://schema.org",
         "@type": "BreadcrumbList",
         "itemListElement": [
-            {"@type": "ListItem", "position": 1, "name": "ホーム", "item": "https://apipedia.dev/"},
-            {"@type": "ListItem", "position": 2, "name": "カタログ", "item": "https://apipedia.dev/#catalog"},
-            {"@type": "ListItem", "position": 3, "name": api['name'], "item": f"https://apipedia.dev/api/{api['id']}/"}
+            {"@type": "ListItem", "position": 1, "name": locale['text']['home'], "item": "https://apipedia.dev/"},
+            {"@type": "ListItem", "position": 2, "name": locale['text']['catalog'], "item": "https://apipedia.dev/#catalog"},
+            {"@type": "ListItem", "position": 3, "name": api['name'], "item": page_url}
         ]
     }, ensure_ascii=False)
 
     # Affiliate link handling
-    affiliate = api.get('affiliate', {})
-    if affiliate.get('enabled'):
-        official_url = escape(affiliate.get('url', api.get('url', '#')))
+    if record['affiliate']:
+        official_url = record['official_url']
         official_rel = 'sponsored noopener'
-        official_label = escape(affiliate.get('label', '公式サイトへ'))
-        affiliate_disclosure = '<p class="affiliate-disclosure">※ アフィリエイトリンクを含みます</p>'
+        official_label = record['affiliate_label'] or text['affiliate_label']
+        affiliate_disclosure = f'<p class="affiliate-disclosure">{text["affiliate_disclosure"]}</p>'
     else:
-        official_url = escape(api.get('url', '#'))
+        official_url = record['official_url']
         official_rel = 'noopener'
-        official_label = '公式サイト'
+        official_label = text['official_site']
         affiliate_disclosure = ''
 
-    # Related APIs (same category, excluding self, sorted by popularity, top 5)
     related_html = ''
-    if all_apis and cat:
-        related = [a for a in all_apis if a['category'] == api['category'] and a['id'] != api['id']]
-        related.sort(key=lambda a: (a.get('popularity', {}).get('score', 0)), reverse=True)
-        related = related[:5]
-        if related:
-            items = ''.join(
-                f'<a href="../{escape(a["id"])}/" class="related-api-card">'
-                f'<div class="related-api-name">{escape(a["name"])}</div>'
-                f'<div class="related-api-desc">{escape(a["description"][:60])}{"..." if len(a["description"]) > 60 else ""}</div>'
-                f'<div class="related-api-meta">'
-                f'<span class="pill pill--{a.get("pricing", "")}">{PRICING_LABEL.get(a.get("pricing", ""), "")}</span>'
-                f'{"<span class=score-mini score-mini--" + get_popularity_class(a.get("popularity", {}).get("score", 0)) + ">" + str(a["popularity"]["score"]) + "点</span>" if a.get("popularity", {}).get("score") else ""}'
-                f'</div>'
-                f'</a>'
-                for a in related
-            )
-            related_html = f'<div class="section-block"><h2 class="section-heading">関連API（{cat_icon} {cat_name}）</h2><div class="related-apis-grid">{items}</div></div>'
+    if record['related']:
+        items = ''.join(
+            f'<a href="../{escape(a["id"])}/" class="related-api-card">{cached_fragment(render_card_fragment, a, locale)}</a>'
+            for a in record['related']
+        )
+        guide_link = ''
+        if record['has_guide']:
+            guide_link = f'<p style="margin-top:12px;font-size:0.85rem;"><a href="{root}guides/{guide_filename(cat["id"])}">{text["guide_link"].format(category=cat_name)} &rarr;</a></p>'
+        related_html = f'<div class="section-block"><h2 class="section-heading">{text["related"].format(icon=cat_icon, category=cat_name)}</h2><div class="related-apis-grid">{items}</div>{guide_link}</div>'
 
     # Build metrics HTML
     metrics_html = ''
-    metric_items = []
-    if pop.get('monthlyUsers'):
-        metric_items.append(f'<div class="metric-card"><div class="metric-label">利用者数</div><div class="metric-value">{escape(pop["monthlyUsers"])}</div></div>')
-    if pop.get('monthlyApiCalls'):
-        metric_items.append(f'<div class="metric-card"><div class="metric-label">APIコール数</div><div class="metric-value">{escape(pop["monthlyApiCalls"])}</div></div>')
-    if pop.get('marketShare'):
-        metric_items.append(f'<div class="metric-card"><div class="metric-label">市場ポジション</div><div class="metric-value">{escape(pop["marketShare"])}</div></div>')
-    if pop.get('npmDownloads'):
-        metric_items.append(f'<div class="metric-card"><div class="metric-label">npm ダウンロード</div><div class="metric-value">{escape(pop["npmDownloads"])}</div></div>')
-    if pop.get('githubStars'):
-        metric_items.append(f'<div class="metric-card"><div class="metric-label">GitHub Stars</div><div class="metric-value">{escape(pop["githubStars"])}</div></div>')
-    if metric_items:
-        metrics_html = f'<div class="section-block"><h2 class="section-heading">利用実績・指標</h2><div class="metrics-grid">{"".join(metric_items)}</div></div>'
+    metrics = [(key, fields[key]) for key in METRIC_KEYS if fields[key][0]]
+    if metrics:
+        metric_items = ''.join(
+            f'<div class="metric-card"><div class="metric-label">{text[key]}</div><div class="metric-value"{lang_attr(fallback)}>{value}</div></div>'
+            for key, (value, fallback) in metrics
+        )
+        metrics_html = f'<div class="section-block"><h2 class="section-heading">{text["metrics"]}</h2><div class="metrics-grid">{metric_items}</div></div>'
 
     # Adopters
     adopters_html = ''
-    if pop.get('adopters'):
-        chips = ''.join(f'<span class="adopter-chip">{escape(a)}</span>' for a in pop['adopters'])
-        adopters_html = f'<div class="section-block"><h2 class="section-heading">主な利用企業・サービス</h2><div class="adopters-wrap">{chips}</div></div>'
+    adopters, adopters_fallback = fields['adopters']
+    if adopters:
+        adopters_html = f'<div class="section-block"><h2 class="section-heading">{text["adopters"]}</h2><div class="adopters-wrap"{lang_attr(adopters_fallback)}>{adopters}</div></div>'
 
     # Sources
     sources_html = ''
-    if pop.get('sources'):
-        items = ''.join(f'<li><a href="{escape(s["url"])}" target="_blank" rel="noopener" class="source-link">{escape(s["label"])}</a></li>' for s in pop['sources'])
-        sources_html = f'<div class="section-block"><h2 class="section-heading">根拠・参照元</h2><ul class="sources-list">{items}</ul></div>'
+    if record['sources']:
+        sources_html = f'<div class="section-block"><h2 class="section-heading">{text["sources"]}</h2><ul class="sources-list"{data_lang}>{record["sources"]}</ul></div>'
 
     # Use cases
     usecases_html = ''
-    if use_cases:
-        items = ''.join(f'<span class="usecase-tag">{escape(u)}</span>' for u in use_cases)
-        usecases_html = f'<div class="section-block"><h2 class="section-heading">ユースケース</h2><div class="usecases-wrap">{items}</div></div>'
+    usecases, usecases_fallback = fields['usecases']
+    if usecases:
+        usecases_html = f'<div class="section-block"><h2 class="section-heading">{text["usecases"]}</h2><div class="usecases-wrap"{lang_attr(usecases_fallback)}>{usecases}</div></div>'
 
     # Tags
     tags_html = ''
+    tags, tags_fallback = fields['tags']
     if tags:
-        items = ''.join(f'<span class="tag">{escape(t)}</span>' for t in tags)
-        tags_html = f'<div class="tags-wrap">{items}</div>'
+        tags_html = f'<div class="tags-wrap"{lang_attr(tags_fallback)}>{tags}</div>'
 
     # Trading capability
     trading_access_html = ''
-    if trading_access:
+    if record['trading_access']:
         evidence_items = ''
-        if trading_access.get('evidence'):
+        if record['evidence']:
             links = ''.join(
-                f'<li><a href="{escape(item.get("url", ""))}" target="_blank" rel="noopener" class="source-link">{escape(item.get("label", "参照資料"))}</a></li>'
-                for item in trading_access['evidence']
-                if item.get('url')
+                f'<li><a href="{url}" target="_blank" rel="noopener" class="source-link"{data_lang if label else ""}>{label or text["evidence"]}</a></li>'
+                for url, label in record['evidence']
             )
-            if links:
-                evidence_items = f'<ul class="sources-list" style="margin-top:12px;">{links}</ul>'
+            evidence_items = f'<ul class="sources-list" style="margin-top:12px;">{links}</ul>'
+        trading_detail, trading_detail_fallback = fields['trading_detail']
         trading_access_html = (
-            f'<div class="section-block"><h2 class="section-heading">取引可否（実行/照会）</h2>'
-            f'<div class="detail-text">{trading_detail}</div>{evidence_items}</div>'
+            f'<div class="section-block"><h2 class="section-heading">{text["trading"]}</h2>'
+            f'<div class="detail-text"{lang_attr(trading_detail_fallback)}>{trading_detail}</div>{evidence_items}</div>'
         )
 
     return f'''<!DOCTYPE html>
-<html lang="ja" data-theme="light">
+<html lang="{locale["lang"]}" data-theme="light">
 <head>
 <script>
 (function(){{var t=localStorage.getItem('apipedia_theme')||'light';document.documentElement.setAttribute('data-theme',t);}})();
@@ -196,27 +487,28 @@ def generate_page(api, categories, all_apis=None):
 </script>
 <meta charset="UTF-8">
 <meta name="viewport" content="width=device-width, initial-scale=1.0">
-<title>{name} - APIpedia | 日本語APIカタログ</title>
+<title>{name} - APIpedia | {text["site_tagline"]}</title>
 <meta name="description" content="{desc}">
 <!-- OGP -->
 <meta property="og:type" content="article">
-<meta property="og:title" content="{name} — APIpedia | 日本語APIカタログ">
+<meta property="og:title" content="{name} — APIpedia | {text["site_tagline"]}">
 <meta property="og:description" content="{desc}">
-<meta property="og:url" content="https://apipedia.dev/api/{api["id"]}/">
+<meta property="og:url" content="{page_url}">
 <meta property="og:image" content="/og-image.png">
 <meta property="og:image:width" content="1200">
 <meta property="og:image:height" content="630">
 <meta property="og:image:alt" content="API Catalog JP">
 <meta property="og:site_name" content="APIPedia">
-<meta property="og:locale" content="ja_JP">
+<meta property="og:locale" content="{locale["og_locale"]}">
 <meta name="twitter:card" content="summary_large_image">
 <meta name="twitter:title" content="{name} — APIpedia">
 <meta name="twitter:description" content="{desc}">
 <link rel="icon" type="image/svg+xml" href="/favicon.svg">
-<link rel="canonical" href="https://apipedia.dev/api/{api["id"]}/">
-<script type="application/ld+json">{jsonld}</script>
+<link rel="canonical" href="{page_url}">
+{alternates}
+<script type="application/ld+json">{record["jsonld"]}</script>
 <script type="application/ld+json">{breadcrumb_jsonld}</script>
-<link rel="stylesheet" href="../../assets/style.css">
+<link rel="stylesheet" href="{root}assets/style.css">
 <style>
   .api-detail {{ max-width: 800px; margin: 0 auto; padding: calc(var(--header-height) + 40px) 24px 80px; }}
   .breadcrumb {{ font-size: 0.82rem; color: var(--text-muted); margin-bottom: 24px; }}
@@ -288,49 +580,50 @@ def generate_page(api, categories, all_apis=None):
 
 <header class="site-header">
   <div class="container">
-    <a href="../../index.html" class="site-header__logo"><span>APIpedia</span></a>
+    <a href="{root}index.html" class="site-header__logo"><span>APIpedia</span></a>
     <nav class="site-header__nav">
-      <a href="../../index.html" class="nav-link">カタログ</a>
-      <a href="../../guides/" class="nav-link">ガイド</a>
+      <a href="{root}index.html" class="nav-link">{text["catalog"]}</a>
+      <a href="{root}guides/" class="nav-link">{text["guides"]}</a>
+      {switch_link}
     </nav>
     <div class="site-header__actions">
-      <button class="theme-toggle" id="themeToggle" aria-label="テーマ切替" title="ダーク/ライトモード切替">&#x1F319;</button>
-      <button class="mobile-menu-btn" aria-label="メニュー">&#9776;</button>
+      <button class="theme-toggle" id="themeToggle" aria-label="{text["theme_toggle"]}" title="{text["theme_toggle_title"]}">&#x1F319;</button>
+      <button class="mobile-menu-btn" aria-label="{text["menu"]}">&#9776;</button>
     </div>
   </div>
 </header>
 
 <main class="api-detail">
   <div class="breadcrumb">
-    <a href="../../index.html">APIpedia</a> &rsaquo;
-    <a href="../../index.html#catalog">カタログ</a> &rsaquo;
+    <a href="{root}index.html">APIpedia</a> &rsaquo;
+    <a href="{root}index.html#catalog">{text["catalog"]}</a> &rsaquo;
     {name}
   </div>
 
   <div class="api-hero">
     <h1>{name}</h1>
-    {f'<div class="subtitle">{name_ja}</div>' if name_ja != name else ''}
+    {f'<div class="subtitle"{data_lang}>{name_ja}</div>' if name_ja != name else ''}
     <div class="badge-row">
       <span class="badge badge--pricing">{pricing}</span>
       <span class="badge badge--region">{region}</span>
       {f'<span class="badge badge--category">{cat_icon} {cat_name}</span>' if cat else ''}
       <span class="badge badge--difficulty">{difficulty}</span>
-      {'<span class="badge badge--featured">&#x2B50; 注目</span>' if api.get('featured') else ''}
+      {f'<span class="badge badge--featured">&#x2B50; {text["featured"]}</span>' if api.get('featured') else ''}
     </div>
   </div>
 
-  <p class="api-desc">{desc}</p>
+  <p class="api-desc"{lang_attr(desc_fallback)}>{desc}</p>
 
   {f"""<div class="score-hero">
     <div class="score-number" style="color:{score_color};">{score}</div>
     <div class="score-detail">
-      <div class="score-label">人気スコア（100点満点）</div>
+      <div class="score-label">{text["score_label"]}</div>
       <div class="score-bar-outer"><div class="score-bar-fill" style="width:{score}%;background:linear-gradient(90deg,{gradient});"></div></div>
-      {f'<div class="score-reason">{escape(pop.get("reason", ""))}</div>' if pop.get('reason') else ''}
+      {f'<div class="score-reason"{lang_attr(fields["reason"][1])}>{fields["reason"][0]}</div>' if fields['reason'][0] else ''}
     </div>
   </div>""" if score else ''}
 
-  {f'<div class="section-block"><h2 class="section-heading">詳細分析</h2><div class="detail-text">{escape(pop.get("detail", ""))}</div></div>' if pop.get('detail') else ''}
+  {f'<div class="section-block"><h2 class="section-heading">{text["analysis"]}</h2><div class="detail-text"{lang_attr(fields["detail"][1])}>{fields["detail"][0]}</div></div>' if fields['detail'][0] else ''}
 
   {metrics_html}
   {adopters_html}
@@ -338,25 +631,25 @@ def generate_page(api, categories, all_apis=None):
   {trading_access_html}
 
   <div class="section-block">
-    <h2 class="section-heading">API仕様</h2>
+    <h2 class="section-heading">{text["spec"]}</h2>
     <div class="spec-grid">
-      <div class="spec-item"><div class="label">認証方式</div><div class="value">{auth}</div></div>
-      <div class="spec-item"><div class="label">レスポンス形式</div><div class="value">{response_fmt}</div></div>
-      <div class="spec-item"><div class="label">レート制限</div><div class="value">{rate_limit}</div></div>
-      <div class="spec-item"><div class="label">料金</div><div class="value">{pricing_detail}</div></div>
-      {f'<div class="spec-item spec-item--full"><div class="label">取引可否</div><div class="value">{trading_label}</div></div>' if trading_label else ''}
-      {f'<div class="spec-item spec-item--full"><div class="label">SDK</div><div class="value">{sdks}</div></div>' if sdks else ''}
+      <div class="spec-item"><div class="label">{text["spec_auth"]}</div><div class="value">{spec["auth"]}</div></div>
+      <div class="spec-item"><div class="label">{text["spec_response"]}</div><div class="value">{spec["response_fmt"]}</div></div>
+      <div class="spec-item"><div class="label">{text["spec_rate_limit"]}</div><div class="value">{spec["rate_limit"]}</div></div>
+      <div class="spec-item"><div class="label">{text["spec_pricing"]}</div><div class="value">{spec["pricing_detail"]}</div></div>
+      {f'<div class="spec-item spec-item--full"><div class="label">{text["spec_trading"]}</div><div class="value">{spec["trading_label"]}</div></div>' if spec["trading_label"] else ''}
+      {f'<div class="spec-item spec-item--full"><div class="label">SDK</div><div class="value">{spec["sdks"]}</div></div>' if spec["sdks"] else ''}
     </div>
   </div>
 
   {usecases_html}
 
-  {f'<div class="section-block"><h2 class="section-heading">タグ</h2>{tags_html}</div>' if tags else ''}
+  {f'<div class="section-block"><h2 class="section-heading">{text["tags"]}</h2>{tags_html}</div>' if tags_html else ''}
 
   {related_html}
 
   <div class="action-buttons">
-    <a href="{escape(api.get('docsUrl') or api.get('url', '#'))}" target="_blank" rel="noopener" class="btn btn--primary">ドキュメントを見る</a>
+    <a href="{record['docs_url']}" target="_blank" rel="noopener" class="btn btn--primary">{text["docs_button"]}</a>
     <a href="{official_url}" target="_blank" rel="{official_rel}" class="btn btn--ghost">{official_label}</a>
   </div>
   {affiliate_disclosure}
@@ -367,11 +660,11 @@ def generate_page(api, categories, all_apis=None):
     <div class="site-footer__inner">
       <div>
         <div class="site-footer__brand">APIpedia</div>
-        <div class="site-footer__text">日本語APIカタログ</div>
+        <div class="site-footer__text">{text["site_tagline"]}</div>
       </div>
       <div class="site-footer__links">
-        <a href="../../index.html">トップ</a>
-        <a href="../../guides/">ガイド</a>
+        <a href="{root}index.html">{text["top"]}</a>
+        <a href="{root}guides/">{text["guides"]}</a>
       </div>
     </div>
     <div class="site-footer__copyright">&copy; 2026 APIpedia. All rights reserved.</div>
@@ -403,7 +696,310 @@ def generate_page(api, categories, all_apis=None):
 </html>'''
 
 
-def generate_sitemap(apis):
+def guide_filename(cat_id):
+    return f'{cat_id}-api-ranking.html'
+
+
+def guide_digest(cat, members, comparison=None):
+    """ガイドの入力（カテゴリ・所属APIレコード・共有フラグメントの出力・対応する手書きガイド）のハッシュ"""
+    members = sorted(members, key=lambda a: a['id'])
+    payload = json.dumps({
+        'version': GUIDE_TEMPLATE_VERSION,
+        'category': cat,
+        'comparison': comparison,
+        'apis': members,
+        'fragments': [
+            [cached_fragment(render_card_fragment, a), cached_fragment(render_row_fragment, a)]
+            for a in members
+        ],
+    }, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def read_guide_digest(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        m = GUIDE_DIGEST_RE.search(f.read(512))
+    return m.group(1) if m else None
+
+
+def render_compare_table(ranked):
+    rows = '\n          '.join(
+        f'<tr><td>{rank}</td>{cached_fragment(render_row_fragment, a)}</tr>'
+        for rank, a in enumerate(ranked, 1)
+    )
+    return f'''<div class="compare-matrix">
+      <table>
+        <thead>
+          <tr><th>順位</th><th>API</th><th>スコア</th><th>料金</th><th>認証方式</th><th>レート制限</th><th>料金詳細</th><th>地域</th><th>難易度</th></tr>
+        </thead>
+        <tbody>
+          {rows}
+        </tbody>
+      </table>
+    </div>'''
+
+
+def generate_guide(cat, members, updated, digest, comparison=None):
+    """comparison: 同じカテゴリの手書き比較ガイドのファイル名（あればそちらを canonical にする）"""
+    ranked = sort_by_popularity(members)
+    cat_name = escape(cat['name'])
+    cat_icon = cat.get('icon', '')
+    year = updated[:4]
+    filename = guide_filename(cat['id'])
+    canonical = comparison or filename
+    title = f'【{year}年版】{cat_name}API {len(ranked)}選 比較・人気ランキング'
+    names = ' / '.join(escape(a['name']) for a in ranked[:5])
+    desc = escape(f'{cat["name"]}APIを人気スコア・料金・認証方式・レート制限で比較。{cat.get("description", "")}')
+
+    article_jsonld = json.dumps({
+        "@context": "https://schema.org",
+        "@type": "Article",
+        "headline": f'【{year}年版】{cat["name"]}API 比較・人気ランキング',
+        "description": f'{cat["name"]}APIを人気スコア・料金・認証方式・レート制限で比較',
+        "dateModified": updated,
+        "author": {"@type": "Organization", "name": "APIpedia"},
+        "publisher": {"@type": "Organization", "name": "APIpedia", "url": "https://apipedia.dev/"}
+    }, ensure_ascii=False)
+
+    breadcrumb_jsonld = json.dumps({
+        "@context": "https://schema.org",
+        "@type": "BreadcrumbList",
+        "itemListElement": [
+            {"@type": "ListItem", "position": 1, "name": "APIpedia", "item": "https://apipedia.dev/"},
+            {"@type": "ListItem", "position": 2, "name": "ガイド", "item": "https://apipedia.dev/guides/"},
+            {"@type": "ListItem", "position": 3, "name": f'{cat["name"]}API比較・ランキング'}
+        ]
+    }, ensure_ascii=False)
+
+    cards = ''.join(
+        f'<a href="/api/{escape(a["id"])}/" class="related-api-card"><div class="rank-label">{rank}位</div>{cached_fragment(render_card_fragment, a)}</a>'
+        for rank, a in enumerate(ranked, 1)
+    )
+    comparison_link = ''
+    if comparison:
+        comparison_link = f'\n    <p>各APIの特徴やユースケース別のおすすめ、実装例は<a href="{comparison}">{cat_name}API 比較ガイド</a>で解説しています。</p>'
+
+    return f"""<!DOCTYPE html>
+<!-- apipedia-guide-digest: {digest} -->
+<html lang="ja" data-theme="light">
+<head>
+<script>
+(function(){{var t=localStorage.getItem('apipedia_theme')||'light';document.documentElement.setAttribute('data-theme',t);}})();
+</script>
+<meta charset="UTF-8">
+<meta name="viewport" content="width=device-width, initial-scale=1.0">
+<title>{title} | APIpedia</title>
+<meta name="description" content="{desc}">
+<!-- OGP -->
+<meta property="og:type" content="article">
+<meta property="og:title" content="{title} | APIPedia">
+<meta property="og:description" content="{desc}">
+<meta property="og:url" content="https://apipedia.dev/guides/{filename}">
+<meta property="og:image" content="/og-image.png">
+<meta property="og:site_name" content="APIPedia">
+<meta property="og:locale" content="ja_JP">
+<meta name="twitter:card" content="summary_large_image">
+<meta name="twitter:title" content="{title} | APIPedia">
+<meta name="twitter:description" content="{desc}">
+<link rel="icon" type="image/svg+xml" href="/favicon.svg">
+<link rel="canonical" href="https://apipedia.dev/guides/{canonical}">
+<script type="application/ld+json">{article_jsonld}</script>
+<script type="application/ld+json">{breadcrumb_jsonld}</script>
+<link rel="stylesheet" href="/assets/style.css">
+<style>
+  .guide-page {{ padding: calc(var(--header-height) + 24px) 0 80px; }}
+  .guide-breadcrumb {{ font-size: 0.8rem; color: var(--text-muted); margin-bottom: 24px; }}
+  .guide-breadcrumb a {{ color: var(--color-primary); text-decoration: none; }}
+  .guide-header {{ margin-bottom: 40px; }}
+  .guide-header__badge {{ display: inline-block; font-size: 0.72rem; font-weight: 700; padding: 4px 12px; background: var(--color-primary-light); color: var(--color-primary); border-radius: var(--radius-pill); margin-bottom: 12px; }}
+  .guide-header h1 {{ font-size: 1.8rem; font-weight: 800; color: var(--text-primary); margin-bottom: 12px; line-height: 1.4; }}
+  .guide-header__meta {{ font-size: 0.82rem; color: var(--text-muted); display: flex; gap: 16px; flex-wrap: wrap; }}
+  .guide-content {{ max-width: 960px; }}
+  .guide-content h2 {{ font-size: 1.3rem; font-weight: 700; color: var(--text-primary); margin: 40px 0 16px; padding-bottom: 8px; border-bottom: 2px solid var(--color-primary); display: inline-block; }}
+  .guide-content p {{ font-size: 0.9rem; color: var(--text-secondary); line-height: 1.9; margin-bottom: 16px; }}
+  .compare-matrix {{ overflow-x: auto; margin: 24px 0 32px; border-radius: var(--radius); border: 1px solid var(--border-color); }}
+  .compare-matrix table {{ width: 100%; border-collapse: collapse; font-size: 0.82rem; background: var(--bg-card); min-width: 800px; }}
+  .compare-matrix thead {{ background: var(--bg-secondary); }}
+  .compare-matrix th {{ padding: 12px 14px; text-align: left; font-weight: 700; color: var(--text-primary); font-size: 0.75rem; border-bottom: 2px solid var(--border-color); white-space: nowrap; }}
+  .compare-matrix td {{ padding: 12px 14px; border-top: 1px solid rgba(255,255,255,0.04); color: var(--text-secondary); vertical-align: top; }}
+  .compare-matrix .api-name {{ font-weight: 600; white-space: nowrap; }}
+  .compare-matrix .api-name a {{ color: var(--color-primary); text-decoration: none; }}
+  .related-apis-grid {{ display: grid; grid-template-columns: repeat(auto-fill, minmax(220px, 1fr)); gap: 12px; }}
+  .related-api-card {{ display: block; padding: 16px; background: var(--bg-secondary); border: 1px solid var(--border-color); border-radius: 10px; text-decoration: none; transition: all 0.2s; }}
+  .related-api-card:hover {{ border-color: var(--color-primary); transform: translateY(-2px); }}
+  .rank-label {{ font-size: 0.72rem; font-weight: 700; color: var(--color-primary); margin-bottom: 4px; }}
+  .related-api-name {{ font-size: 0.9rem; font-weight: 600; color: var(--text-primary); margin-bottom: 4px; }}
+  .related-api-desc {{ font-size: 0.78rem; color: var(--text-muted); line-height: 1.5; margin-bottom: 8px; }}
+  .related-api-meta {{ display: flex; align-items: center; gap: 8px; }}
+  .pill {{ display: inline-block; padding: 2px 8px; font-size: 0.7rem; font-weight: 600; border-radius: 20px; }}
+  .pill--free {{ color: var(--color-success); background: var(--color-success-light); }}
+  .pill--freemium {{ color: var(--color-primary); background: var(--color-primary-light); }}
+  .pill--paid {{ color: var(--color-warning); background: var(--color-warning-light); }}
+  .score-mini {{ font-size: 0.75rem; font-weight: 700; }}
+  .score-mini--high {{ color: var(--color-success); }}
+  .score-mini--medium {{ color: var(--color-warning); }}
+  .score-mini--low {{ color: #94a3b8; }}
+  @media (max-width: 768px) {{
+    .guide-header h1 {{ font-size: 1.3rem; }}
+  }}
+</style>
+</head>
+<body>
+
+<header class="site-header">
+  <div class="container">
+    <a href="/" class="site-header__logo"><span>APIpedia</span></a>
+    <nav class="site-header__nav">
+      <a href="/" class="nav-link">カタログ</a>
+      <a href="/guides/" class="nav-link">ガイド</a>
+    </nav>
+    <div class="site-header__actions">
+      <button class="theme-toggle" id="themeToggle" aria-label="テーマ切替" title="ダーク/ライトモード切替">&#x1F319;</button>
+      <button class="mobile-menu-btn" aria-label="メニュー">&#9776;</button>
+    </div>
+  </div>
+</header>
+
+<main class="guide-page">
+<div class="container">
+  <div class="guide-breadcrumb">
+    <a href="/">APIpedia</a> &gt; <a href="/guides/">ガイド</a> &gt; {cat_name}API比較・ランキング
+  </div>
+
+  <div class="guide-header">
+    <span class="guide-header__badge">比較・ランキング</span>
+    <h1>{title}<br>{names}</h1>
+    <div class="guide-header__meta">
+      <span>更新日: {escape(updated)}</span>
+      <span>カテゴリ: {cat_icon} {cat_name}</span>
+    </div>
+  </div>
+
+  <div class="guide-content">
+    <p>APIpediaに掲載している{cat_name}API {len(ranked)}件を、人気スコア（100点満点）順に並べ、料金・認証方式・レート制限・対応地域・難易度を一覧で比較します。このページはカタログデータから自動生成されています。</p>{comparison_link}
+
+    <h2 id="comparison">比較表</h2>
+    {render_compare_table(ranked)}
+
+    <h2 id="ranking">人気ランキング</h2>
+    <div class="related-apis-grid">{cards}</div>
+  </div>
+</div>
+</main>
+
+<footer class="site-footer">
+  <div class="container">
+    <div class="site-footer__inner">
+      <div>
+        <div class="site-footer__brand">APIpedia</div>
+        <div class="site-footer__text">日本語APIカタログ</div>
+      </div>
+      <div class="site-footer__links">
+        <a href="/">トップ</a>
+        <a href="/guides/">ガイド</a>
+      </div>
+    </div>
+    <div class="site-footer__copyright">&copy; 2026 APIpedia. All rights reserved.</div>
+  </div>
+</footer>
+
+<script>
+(function() {{
+  var saved = localStorage.getItem('apipedia_theme');
+  var theme = saved || 'light';
+  document.documentElement.setAttribute('data-theme', theme);
+  updateIcon(theme);
+  var btn = document.getElementById('themeToggle');
+  if (btn) btn.addEventListener('click', function() {{
+    var current = document.documentElement.getAttribute('data-theme');
+    var next = current === 'dark' ? 'light' : 'dark';
+    document.documentElement.setAttribute('data-theme', next);
+    localStorage.setItem('apipedia_theme', next);
+    updateIcon(next);
+  }});
+  function updateIcon(t) {{
+    var btn = document.getElementById('themeToggle');
+    if (btn) btn.innerHTML = t === 'dark' ? '&#x1F319;' : '&#x2600;&#xFE0F;';
+  }}
+}})();
+</script>
+
+</body>
+</html>"""
+
+
+def generate_guides_index_block(guide_cats):
+    """ガイド一覧ページに差し込む、カテゴリ別ランキングガイドのカード"""
+    cards = []
+    for cat, members in guide_cats:
+        tags = ''.join(
+            f'<span class="guide-card__api-tag">{escape(a["name"])}</span>'
+            for a in sort_by_popularity(members)[:5]
+        )
+        cards.append(
+            f'<div class="guide-card">'
+            f'<div class="guide-card__icon">{cat.get("icon", "")}</div>'
+            f'<div class="guide-card__title">{escape(cat["name"])}API 比較・ランキング</div>'
+            f'<div class="guide-card__desc">{len(members)}件の{escape(cat["name"])}APIを人気スコア・料金・認証方式・レート制限で比較。</div>'
+            f'<div class="guide-card__apis">{tags}</div>'
+            f'<a href="{guide_filename(cat["id"])}" class="guide-card__link">ランキングを見る &rarr;</a>'
+            f'</div>'
+        )
+    return (
+        '\n    <h2 class="guides-section-title">カテゴリ別 比較・ランキング</h2>\n'
+        f'    <div class="guides-grid">\n      {(chr(10) + "      ").join(cards)}\n    </div>\n    '
+    )
+
+
+def update_guides_index(guide_cats):
+    with open(GUIDES_INDEX_FILE, 'r', encoding='utf-8') as f:
+        content = f.read()
+    block = generate_guides_index_block(guide_cats)
+    new_content = GUIDES_INDEX_BLOCK_RE.sub(lambda m: m.group(1) + block + m.group(2), content)
+    if new_content != content:
+        with open(GUIDES_INDEX_FILE, 'w', encoding='utf-8') as f:
+            f.write(new_content)
+
+
+def find_comparison_pages():
+    """比較表の差し込みマーカーを持つ手書きガイドを {カテゴリID: ファイル名} で返す"""
+    pages = {}
+    for path in sorted(glob.glob(os.path.join(GUIDES_DIR, '*.html'))):
+        with open(path, 'r', encoding='utf-8') as f:
+            m = CATALOG_TABLE_RE.search(f.read())
+        if m:
+            pages[m.group(2)] = os.path.basename(path)
+    return pages
+
+
+def generate_catalog_table_block(cat, members):
+    """手書きの比較ガイドに差し込む、カテゴリの全APIの比較表（ランキングガイドと同じ行フラグメント）"""
+    ranked = sort_by_popularity(members)
+    cat_name = escape(cat['name'])
+    return (
+        f'\n    <h3 id="catalog-table">掲載中の{cat_name}API {len(ranked)}件の比較（カタログから自動生成）</h3>\n'
+        f'    {render_compare_table(ranked)}\n'
+        f'    <p>人気スコア順のランキングは<a href="{guide_filename(cat["id"])}">{cat_name}API 比較・人気ランキング</a>を参照してください。</p>\n    '
+    )
+
+
+def update_comparison_page(filename, cat, members):
+    """手書きの比較ガイドの生成部分を更新する。書き換えたら True"""
+    path = os.path.join(GUIDES_DIR, filename)
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    block = generate_catalog_table_block(cat, members)
+    new_content = CATALOG_TABLE_RE.sub(lambda m: m.group(1) + block + m.group(3), content)
+    if new_content == content:
+        return False
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(new_content)
+    return True
+
+
+def generate_sitemap(apis, guide_files):
     base_url = 'https://apipedia.dev'
     urls = [
         f'  <url><loc>{base_url}/</loc><priority>1.0</priority><changefreq>weekly</changefreq></url>',
@@ -411,18 +1007,21 @@ def generate_sitemap(apis):
         f'  <url><loc>{base_url}/lean-canvas.html</loc><priority>0.5</priority><changefreq>monthly</changefreq></url>',
         f'  <url><loc>{base_url}/strategy.html</loc><priority>0.5</priority><changefreq>monthly</changefreq></url>',
         f'  <url><loc>{base_url}/guides/</loc><priority>0.8</priority><changefreq>weekly</changefreq></url>',
-        f'  <url><loc>{base_url}/guides/payment-api-comparison.html</loc><priority>0.8</priority><changefreq>monthly</changefreq></url>',
-        f'  <url><loc>{base_url}/guides/auth-api-comparison.html</loc><priority>0.8</priority><changefreq>monthly</changefreq></url>',
-        f'  <url><loc>{base_url}/guides/ai-api-comparison.html</loc><priority>0.8</priority><changefreq>monthly</changefreq></url>',
-        f'  <url><loc>{base_url}/guides/notification-api-comparison.html</loc><priority>0.8</priority><changefreq>monthly</changefreq></url>',
-        f'  <url><loc>{base_url}/guides/maps-api-comparison.html</loc><priority>0.8</priority><changefreq>monthly</changefreq></url>',
-        f'  <url><loc>{base_url}/guides/financial-trading-api-comparison.html</loc><priority>0.8</priority><changefreq>monthly</changefreq></url>',
     ]
+    for filename in guide_files:
+        urls.append(f'  <url><loc>{base_url}/guides/{filename}</loc><priority>0.8</priority><changefreq>monthly</changefreq></url>')
     for api in apis:
-        urls.append(f'  <url><loc>{base_url}/api/{api["id"]}/</loc><priority>0.7</priority><changefreq>weekly</changefreq></url>')
+        page_path = f'api/{api["id"]}/'
+        alternates = ''.join(
+            f'<xhtml:link rel="alternate" hreflang="{loc["lang"]}" href="{base_url}/{loc["prefix"]}{page_path}"/>'
+            for loc in LOCALES.values()
+        ) + f'<xhtml:link rel="alternate" hreflang="x-default" href="{base_url}/{LOCALES[DEFAULT_LOCALE]["prefix"]}{page_path}"/>'
+        for locale in LOCALES.values():
+            urls.append(f'  <url><loc>{base_url}/{locale["prefix"]}{page_path}</loc>{alternates}<priority>0.7</priority><changefreq>weekly</changefreq></url>')
 
     return f'''<?xml version="1.0" encoding="UTF-8"?>
 <urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
+        xmlns:xhtml="http://www.w3.org/1999/xhtml"
         xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
         xsi:schemaLocation="http://www.sitemaps.org/schemas/sitemap/0.9
         http://www.sitemaps.org/schemas/sitemap/0.9/sitemap.xsd">
@@ -444,28 +1043,72 @@ def main():
     apis = data['apis']
     categories = data['categories']
 
+    # Locale-independent work is done once per record and shared by every locale
     generated = 0
     for api in apis:
-        api_dir = os.path.join(API_DIR, api['id'])
-        os.makedirs(api_dir, exist_ok=True)
-        page_html = generate_page(api, categories, all_apis=apis)
-        page_path = os.path.join(api_dir, 'index.html')
-        with open(page_path, 'w', encoding='utf-8') as f:
-            f.write(page_html)
-        generated += 1
-
-    # Generate sitemap.xml
+        record = prepare_record(api, categories, all_apis=apis)
+        for locale in LOCALES.values():
+            api_dir = os.path.join(DOCS_DIR, locale['prefix'], 'api', api['id'])
+            os.makedirs(api_dir, exist_ok=True)
+            page_html = generate_page(record, locale)
+            page_path = os.path.join(api_dir, 'index.html')
+            with open(page_path, 'w', encoding='utf-8') as f:
+                f.write(page_html)
+            generated += 1
+
+    # Generate category comparison guides (skip when member records are unchanged)
+    updated = data['metadata'].get('lastUpdated', '')
+    comparison_pages = find_comparison_pages()
+    guides_generated = 0
+    guides_skipped = 0
+    comparisons_updated = 0
+    guide_cats = []
+    for cat in categories:
+        members = [a for a in apis if a['category'] == cat['id']]
+        if len(members) < GUIDE_MIN_APIS:
+            continue
+        guide_cats.append((cat, members))
+        comparison = comparison_pages.get(cat['id'])
+        if comparison and update_comparison_page(comparison, cat, members):
+            comparisons_updated += 1
+        guide_path = os.path.join(GUIDES_DIR, guide_filename(cat['id']))
+        digest = guide_digest(cat, members, comparison)
+        if read_guide_digest(guide_path) == digest:
+            guides_skipped += 1
+            continue
+        with open(guide_path, 'w', encoding='utf-8') as f:
+            f.write(generate_guide(cat, members, updated, digest, comparison))
+        guides_generated += 1
+
+    # Remove generated guides whose category is gone or below GUIDE_MIN_APIS
+    current_guides = {guide_filename(cat['id']) for cat, _ in guide_cats}
+    guides_removed = 0
+    for path in glob.glob(os.path.join(GUIDES_DIR, '*.html')):
+        if os.path.basename(path) not in current_guides and read_guide_digest(path):
+            os.remove(path)
+            guides_removed += 1
+
+    update_guides_index(guide_cats)
+
+    # Generate sitemap.xml (hand-written and generated guides alike, canonical URLs only)
+    non_canonical = {guide_filename(cat_id) for cat_id in comparison_pages}
+    guide_files = sorted(
+        os.path.basename(p) for p in glob.glob(os.path.join(GUIDES_DIR, '*.html'))
+        if os.path.basename(p) != 'index.html' and os.path.basename(p) not in non_canonical
+    )
     sitemap_path = os.path.join(DOCS_DIR, 'sitemap.xml')
     with open(sitemap_path, 'w', encoding='utf-8') as f:
-        f.write(generate_sitemap(apis))
+        f.write(generate_sitemap(apis, guide_files))
 
     # Generate robots.txt
     robots_path = os.path.join(DOCS_DIR, 'robots.txt')
     with open(robots_path, 'w', encoding='utf-8') as f:
         f.write(generate_robots())
 
-    print(f'Generated {generated} API pages')
-    print(f'Generated sitemap.xml ({len(apis)} API URLs)')
+    print(f'Generated {generated} API pages ({len(apis)} APIs x {len(LOCALES)} locales)')
+    print(f'Generated {guides_generated} comparison guides ({guides_skipped} unchanged, {guides_removed} removed)')
+    print(f'Updated catalog tables in {comparisons_updated} of {len(comparison_pages)} hand-written guides')
+    print(f'Generated sitemap.xml ({len(apis) * len(LOCALES)} API URLs, {len(guide_files)} guide URLs)')
     print(f'Generated robots.txt')
 
 
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+APIpedia - 生成物の minify（デプロイ時に実行・任意）
+generate-pages.py が生成した HTML（インライン CSS/JS・JSON-LD を含む）と、
+公開する data/*.json を安全な範囲で圧縮し、ファイルごとの削減バイト数を報告する。
+手書きのページ（index.html など）は対象外。
+
+ファイルを1つずつ読み書きするため、ページ数が増えてもメモリ使用量は1ファイル分に収まる。
+fingerprint-assets.py の前に実行する（ハッシュ付きファイル名が実際に配信するバイト列と一致するように）。
+
+Usage: python minify-output.py [--in-place]
+  --in-place を付けない場合は削減量を表示するだけで、ファイルは書き換えない。
+  編集用の整形済み data/apis.json も書き換わるため、--in-place はデプロイ用のチェックアウトでのみ付けること。
+"""
+
+import glob
+import json
+import os
+import re
+import sys
+
+DOCS_DIR = os.path.join(os.path.dirname(__file__), '..', 'docs')
+
+# docs/ からの相対パス（glob）。生成物と公開データだけを対象にする
+OUTPUT_PATTERNS = [
+    'api/*/index.html',
+    '*/api/*/index.html',          # ロケール別（en/api/{id}/）
+    'guides/*-api-ranking.html',
+    'data/*.json',
+]
+GENERATED_GUIDE_MARKER = '<!-- apipedia-guide-digest:'
+
+# 中身の空白に意味があるため、HTML としての空白圧縮の対象外にする要素
+RAW_BLOCK_RE = re.compile(r'(<(pre|textarea|code|script|style)\b[^>]*>)(.*?)(</\2\s*>)', re.S | re.I)
+# generate-pages.py のガイド差分検出用コメントなど、残す必要のあるコメント
+COMMENT_RE = re.compile(r'<!--(?!\[if|\s*apipedia-).*?-->', re.S)
+WHITESPACE_RE = re.compile(r'\s+')
+BLOCK_TAGS = (
+    'html|head|body|meta|link|title|script|style|div|p|ul|ol|li|h[1-6]|table|thead|tbody|tr|th|td'
+    '|section|header|footer|main|nav|form|article|aside|br|hr|noscript'
+)
+# ブロック要素の前後の空白はレンダリングに影響しないので除去する
+BLOCK_GAP_BEFORE_RE = re.compile(r'\s+(?=</?(?:%s)\b)' % BLOCK_TAGS, re.I)
+BLOCK_GAP_AFTER_RE = re.compile(r'(</?(?:%s)\b[^<>]*>)\s+' % BLOCK_TAGS, re.I)
+
+CSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.S)
+CSS_PUNCT_RE = re.compile(r'\s*([{};,>])\s*')
+CSS_COLON_RE = re.compile(r':\s+')
+SCRIPT_TYPE_RE = re.compile(r'type\s*=\s*["\']?application/(?:ld\+)?json', re.I)
+
+
+def minify_css(css):
+    css = CSS_COMMENT_RE.sub('', css)
+    css = WHITESPACE_RE.sub(' ', css)
+    css = CSS_PUNCT_RE.sub(r'\1', css)
+    # "calc(a + b)" の空白や ".a :hover" の子孫セレクタを壊さないよう、":" は後ろの空白だけ詰める
+    css = CSS_COLON_RE.sub(':', css)
+    return css.replace(';}', '}').strip()
+
+
+def minify_js(js):
+    """行単位の安全な圧縮（インデント・空行・行コメントの除去のみ。ASI を壊さないよう改行は残す）"""
+    lines = []
+    for line in js.splitlines():
+        line = line.strip()
+        if not line or line.startswith('//'):
+            continue
+        lines.append(line)
+    return '\n'.join(lines)
+
+
+def minify_raw_block(m):
+    open_tag, tag, body, close_tag = m.group(1), m.group(2).lower(), m.group(3), m.group(4)
+    if tag == 'style':
+        body = minify_css(body)
+    elif tag == 'script' and body.strip():
+        if SCRIPT_TYPE_RE.search(open_tag):
+            try:
+                body = json.dumps(json.loads(body), ensure_ascii=False, separators=(',', ':'))
+            except json.JSONDecodeError:
+                pass
+        else:
+            body = minify_js(body)
+    return open_tag + body + close_tag
+
+
+def minify_markup(markup):
+    markup = COMMENT_RE.sub('', markup)
+    markup = WHITESPACE_RE.sub(' ', markup)
+    markup = BLOCK_GAP_BEFORE_RE.sub('', markup)
+    return BLOCK_GAP_AFTER_RE.sub(r'\1', markup)
+
+
+def minify_html(text):
+    out = []
+    pos = 0
+    prev_tag = None
+    for m in RAW_BLOCK_RE.finditer(text):
+        markup = minify_markup(text[pos:m.start()])
+        # <code> 以外の生ブロックはブロック要素扱いなので、隣接する空白も除去できる
+        if prev_tag and prev_tag != 'code':
+            markup = markup.lstrip()
+        if m.group(2).lower() != 'code':
+            markup = markup.rstrip()
+        out.append(markup)
+        out.append(minify_raw_block(m))
+        prev_tag = m.group(2).lower()
+        pos = m.end()
+    markup = minify_markup(text[pos:])
+    out.append(markup.lstrip() if prev_tag and prev_tag != 'code' else markup)
+    return ''.join(out).strip()
+
+
+def minify_json_file(src, dst):
+    with open(src, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    with open(dst, 'w', encoding='utf-8') as f:
+        # json.dump は iterencode で逐次書き出す
+        json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+
+
+def minify_html_file(src, dst):
+    with open(src, 'r', encoding='utf-8') as f:
+        text = f.read()
+    with open(dst, 'w', encoding='utf-8') as f:
+        f.write(minify_html(text))
+
+
+MINIFIERS = {
+    '.html': minify_html_file,
+    '.json': minify_json_file,
+}
+
+
+def is_generated_guide(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return GENERATED_GUIDE_MARKER in f.read(512)
+
+
+def iter_output_files():
+    for pattern in OUTPUT_PATTERNS:
+        for path in glob.iglob(os.path.join(DOCS_DIR, pattern)):
+            if '-api-ranking.html' in path and not is_generated_guide(path):
+                continue
+            yield path, MINIFIERS[os.path.splitext(path)[1]]
+
+
+def main():
+    dry_run = '--in-place' not in sys.argv[1:]
+
+    files = 0
+    total_before = 0
+    total_after = 0
+    for path, minify in iter_output_files():
+        tmp_path = path + '.min.tmp'
+        minify(path, tmp_path)
+        before = os.path.getsize(path)
+        after = os.path.getsize(tmp_path)
+        if after >= before:
+            os.remove(tmp_path)
+            after = before
+        elif dry_run:
+            os.remove(tmp_path)
+        else:
+            os.replace(tmp_path, path)
+
+        files += 1
+        total_before += before
+        total_after += after
+        rel = os.path.relpath(path, DOCS_DIR)
+        print(f'  {rel}: {before:,} -> {after:,} bytes (-{before - after:,})')
+
+    saved = total_before - total_after
+    ratio = saved / total_before * 100 if total_before else 0
+    print(f'{"[dry-run] " if dry_run else ""}Minified {files} files: {total_before:,} -> {total_after:,} bytes (-{saved:,}, {ratio:.1f}%)')
+
+
+if __name__ == '__main__':
+    main()